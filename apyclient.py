@@ -5,21 +5,20 @@
 # Released subject to the BSD License
 
 
+import base64
+from collections import OrderedDict
+import copy
 from functools import wraps
-import json
+import hashlib
+import hmac
+import importlib
 import socket
-import six
+import threading
 
-import apysigner
-
-if six.PY2:
-    from urllib import urlencode
-    from urllib2 import HTTPError, urlopen
-    from urlparse import parse_qs
-else:
-    from urllib.request import urlopen
-    from urllib.parse import parse_qs, urlencode
-    from urllib.error import HTTPError
+# apysigner, json and the urllib stack are comparatively slow to import, so
+# they're imported inside the functions that use them. That keeps
+# ``import apyclient`` cheap for processes that never sign, parse JSON or
+# even make a request.
 
 
 __all__ = (
@@ -27,8 +26,251 @@ __all__ = (
     'SignedAPIRequest',
     'BaseResponse',
     'JSONApiResponse',
+    'RequestBody',
+    'JSONBody',
+    'MultipartBody',
+    'PollingAPIClient',
+    'RequestBatcher',
+    'SubResponse',
 )
 
+# Names that used to be imported at module level, still available as
+# ``apyclient.<name>`` but loaded on first access.
+_LAZY_ATTRIBUTES = {
+    'apysigner': ('apysigner', None),
+    'json': ('json', None),
+    'HTTPError': ('urllib.error', 'HTTPError'),
+    'Request': ('urllib.request', 'Request'),
+    'parse_qs': ('urllib.parse', 'parse_qs'),
+    'urlencode': ('urllib.parse', 'urlencode'),
+    'urlparse': ('urllib.parse', 'urlparse'),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    module_name, attr = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+
+def urlopen(url, data=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """
+    ``urllib.request.urlopen``, imported on first use.
+    """
+    import urllib.request
+    return urllib.request.urlopen(url, data=data, timeout=timeout)
+
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+# Quoting of multipart header parameters, the same as urllib3 does.
+_HEADER_PARAM_ESCAPES = {10: "%0A", 13: "%0D", 34: "%22"}
+
+
+def _to_bytes(value):
+    if isinstance(value, _BUFFER_TYPES):
+        return bytes(value)
+    return str(value).encode("utf-8")
+
+
+def _open(url, data, timeout, headers=None):
+    """
+    Opens url, building a full ``Request`` when there are headers to send
+    or data is a ``RequestBody`` (so its content is streamed).
+    """
+    if isinstance(data, RequestBody):
+        return urlopen(data.get_request(url, headers), timeout=timeout)
+    if headers:
+        from urllib.request import Request
+        return urlopen(Request(url, data=data, headers=headers), timeout=timeout)
+    return urlopen(url, data=data, timeout=timeout)
+
+
+class RequestBody(object):
+    """
+    Raw request body that is streamed to the server instead of being
+    urlencoded.
+
+    ``data`` may be text, bytes, a bytearray or memoryview, a file object or
+    any iterable of byte (or text) chunks. Text is sent utf-8 encoded.
+    Buffers are sent as-is with a Content-Length; everything else is read
+    ``chunk_size`` bytes at a time and sent with chunked transfer encoding
+    so it is never fully loaded into memory.
+
+    Return one from an ``api_request`` method or pass it as ``data`` to
+    ``fetch_response``. A body is consumed by the request that sends it,
+    so create a new one for every request and don't share it between
+    threads.
+    """
+    content_type = 'application/octet-stream'
+    chunk_size = 64 * 1024
+    # Largest one-shot iterator kept in memory when it has to be replayed
+    # for signing; anything bigger overflows to a temporary file.
+    spool_size = 1024 * 1024
+
+    def __init__(self, data, content_type=None, chunk_size=None):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.data = data
+        self.content_type = content_type or self.content_type
+        self.chunk_size = chunk_size or self.chunk_size
+        self._start = self._tell(data)
+        self._spool = None
+
+    @staticmethod
+    def _tell(data):
+        try:
+            return data.tell()
+        except (AttributeError, OSError):
+            return None
+
+    @property
+    def headers(self):
+        return {'Content-Type': self.content_type}
+
+    @property
+    def payload(self):
+        """
+        Object handed to ``urlopen`` as request data.
+        """
+        if isinstance(self.data, _BUFFER_TYPES):
+            return self._byte_view()
+        return self
+
+    @property
+    def is_replayable(self):
+        """
+        True when the body can be iterated more than once without spooling.
+        """
+        return isinstance(self.data, _BUFFER_TYPES) or self._start is not None
+
+    def get_request(self, url, headers=None):
+        request_headers = dict(headers or {})
+        request_headers.update(self.headers)
+        from urllib.request import Request
+        return Request(url, data=self.payload, headers=request_headers)
+
+    def update_digest(self, digest):
+        """
+        Feeds the body to ``digest`` chunk by chunk and leaves the body
+        ready to be sent. One-shot iterators are spooled while digesting so
+        they can be replayed.
+        """
+        import tempfile
+        spool = None if self.is_replayable else tempfile.SpooledTemporaryFile(self.spool_size)
+        for chunk in self:
+            digest.update(chunk)
+            if spool is not None:
+                spool.write(chunk)
+        self._spool = spool or self._spool
+        return digest
+
+    def __iter__(self):
+        if self._spool is not None:
+            return self._iter_file(self._spool, 0)
+        return self._iter_data()
+
+    def _iter_data(self):
+        if isinstance(self.data, _BUFFER_TYPES):
+            return self._iter_buffer(self._byte_view())
+        if hasattr(self.data, 'read'):
+            return self._iter_file(self.data, self._start)
+        return (_to_bytes(chunk) for chunk in self.data)
+
+    def _byte_view(self):
+        # Flat view of single bytes, so chunk_size counts bytes whatever the
+        # item size or shape of the buffer (e.g. an array of ints).
+        return memoryview(self.data).cast('B')
+
+    def _iter_buffer(self, view):
+        for offset in range(0, len(view), self.chunk_size):
+            yield view[offset:offset + self.chunk_size].tobytes()
+
+    def _iter_file(self, fileobj, start):
+        if start is not None:
+            fileobj.seek(start)
+        chunk = fileobj.read(self.chunk_size)
+        while chunk:
+            yield _to_bytes(chunk)
+            chunk = fileobj.read(self.chunk_size)
+
+
+class JSONBody(RequestBody):
+    """
+    Sends ``obj`` serialized as a JSON document.
+    """
+    content_type = 'application/json'
+
+    def __init__(self, obj, content_type=None, chunk_size=None):
+        import json
+        self.obj = obj
+        data = json.dumps(obj).encode("utf-8")
+        super(JSONBody, self).__init__(data, content_type, chunk_size)
+
+
+class MultipartBody(RequestBody):
+    """
+    Streams a multipart/form-data body.
+
+    :param fields:
+        A dictionary or sequence of (name, value) pairs of plain form fields.
+    :param files:
+        A dictionary or sequence of (name, (filename, data[, content_type]))
+        pairs. ``data`` is anything a ``RequestBody`` accepts, so files are
+        read a chunk at a time rather than loaded into memory.
+    """
+
+    def __init__(self, fields=None, files=None, boundary=None, chunk_size=None):
+        import uuid
+        self.boundary = boundary or uuid.uuid4().hex
+        self.fields = self._items(fields)
+        self.files = [(name, self._file_part(value, chunk_size)) for name, value in self._items(files)]
+        content_type = 'multipart/form-data; boundary={0}'.format(self.boundary)
+        super(MultipartBody, self).__init__(None, content_type, chunk_size)
+
+    @staticmethod
+    def _items(values):
+        return list(values.items() if hasattr(values, 'items') else values or ())
+
+    @staticmethod
+    def _file_part(value, chunk_size):
+        filename, data = value[:2]
+        content_type = value[2] if len(value) > 2 else None
+        return filename, RequestBody(data, content_type, chunk_size)
+
+    @property
+    def payload(self):
+        return self
+
+    @property
+    def is_replayable(self):
+        return all(body.is_replayable for _, (_, body) in self.files)
+
+    def _iter_data(self):
+        for name, value in self.fields:
+            yield self._part_header(name)
+            yield _to_bytes(value) + b"\r\n"
+        for name, (filename, body) in self.files:
+            yield self._part_header(name, filename, body.content_type)
+            for chunk in body:
+                yield chunk
+            yield b"\r\n"
+        yield "--{0}--\r\n".format(self.boundary).encode("utf-8")
+
+    def _part_header(self, name, filename=None, content_type=None):
+        disposition = 'form-data; name="{0}"'.format(self._quote(name))
+        if filename is not None:
+            disposition += '; filename="{0}"'.format(self._quote(filename))
+        lines = ["--" + self.boundary, "Content-Disposition: " + disposition]
+        if content_type:
+            lines.append("Content-Type: " + content_type)
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+    @staticmethod
+    def _quote(value):
+        return str(value).translate(_HEADER_PARAM_ESCAPES)
+
 
 class BaseResponse(object):
     """
@@ -37,6 +279,10 @@ class BaseResponse(object):
 
     Note that this response is not EXACTLY like a response you'd normally
     get from urlopen. It cannot be used as a drop in replacement.
+
+    Responses are safe to share between threads. The content is read from
+    the original response exactly once; the lock guarding that read is only
+    taken until the content is cached.
     """
     _content = None
 
@@ -47,19 +293,34 @@ class BaseResponse(object):
     def code(self):
         return self.original_response.code
 
+    @property
+    def headers(self):
+        return self.original_response.headers
+
     @property
     def is_success(self):
         # According to RFC 2616, "2xx" code indicates that the client's
         # request was successfully received, understood, and accepted.
         return self.code // 100 == 2
 
+    def _get_lock(self):
+        # Created on first use rather than in __init__ so subclasses that
+        # don't call super still work; setdefault is atomic, so every thread
+        # gets the same lock.
+        lock = self.__dict__.get("_lock")
+        if lock is None:
+            lock = self.__dict__.setdefault("_lock", threading.Lock())
+        return lock
+
     @property
     def content(self):
         """
         Returns raw response content.
         """
         if self._content is None:
-            self._content = self.original_response.read()
+            with self._get_lock():
+                if self._content is None:
+                    self._content = self.original_response.read()
         return self._content
 
 
@@ -67,6 +328,10 @@ class APIRequest(object):
     """
     API method decorator to turn method into easy API call.
     Assumes parent class has "HOST_NAME" defined.
+
+    One decorator instance is shared by every instance of the API class,
+    so it only holds configuration and keeps all per-call state local.
+    Decorated methods can be called from any number of threads.
     """
 
     def __init__(self, endpoint, method="GET", timeout=socket._GLOBAL_DEFAULT_TIMEOUT, response_class=None):
@@ -95,6 +360,7 @@ class APIRequest(object):
 
         @wraps(method)
         def _inner(cls, *args, **kwargs):
+            from urllib.error import HTTPError
             try:
                 method_data = method(cls, *args, **kwargs)
                 url, query_data = self._get_url_and_data(method_data, cls)
@@ -114,15 +380,18 @@ class APIRequest(object):
         :param cls:
             The API class object being decorated.
         """
+        from urllib.parse import urlencode
         url = cls.HOST_NAME + self.endpoint
+        if isinstance(method_data, RequestBody):
+            return url, method_data
         query_data = method_data and urlencode(method_data, doseq=1)
         if self.method == "GET" and query_data:
             url += "?" + query_data
             query_data = None
         return url, query_data
 
-    def _open_url(self, url, query_data):
-        return urlopen(url, data=query_data, timeout=self.TIMEOUT)
+    def _open_url(self, url, query_data, headers=None):
+        return _open(url, query_data, self.TIMEOUT, headers)
 
     def prepare_response(self, response, cls):
         """
@@ -148,21 +417,36 @@ class SignedURLMixin(object):
     CLIENT_ID = ''
     PRIVATE_KEY = ''
 
-    def _open_url(self, url, query_data):
+    def _open_url(self, url, query_data, headers=None):
         """
         Don't sign until last step before opening url
         """
         url = self._get_signed_url(url, query_data)
-        return urlopen(url, data=query_data, timeout=self.TIMEOUT)
+        return _open(url, query_data, self.TIMEOUT, headers)
 
     def _get_signed_url(self, url, query_data):
-        # Currently limited to kinds of data that are key=value pairs.
-        # Binary data is not supported.
         url_with_client = self._get_url_with_client(url)
-        payload = query_data and parse_qs(query_data)
-        signature = apysigner.get_signature(self.PRIVATE_KEY, url_with_client, payload)
+        if isinstance(query_data, RequestBody):
+            signature = self._get_body_signature(url_with_client, query_data)
+        else:
+            import apysigner
+            from urllib.parse import parse_qs
+            payload = query_data and parse_qs(query_data)
+            signature = apysigner.get_signature(self.PRIVATE_KEY, url_with_client, payload)
         return url_with_client + "&{0}={1}".format(self.SIGNATURE_PARAM_NAME, signature)
 
+    def _get_body_signature(self, url, body):
+        """
+        Same HMAC that apysigner computes for a string payload, but fed
+        the body incrementally so large uploads are never fully buffered.
+        """
+        from urllib.parse import urlparse
+        parsed = urlparse(url)
+        url_to_sign = "{path}?{query}".format(path=parsed.path, query=parsed.query)
+        key = base64.urlsafe_b64decode(self.PRIVATE_KEY.encode("utf-8"))
+        digest = body.update_digest(hmac.new(key, url_to_sign.encode("utf-8"), hashlib.sha256))
+        return base64.urlsafe_b64encode(digest.digest()).decode("utf-8")
+
     def _get_url_with_client(self, url):
         url_conjunction = "&" if "?" in url else "?"
         return url + "{url_conj}{param_name}={client_id}".format(
@@ -203,6 +487,8 @@ class BaseAPIClient(object):
 
     See tests for additional examples
 
+    Clients keep no per-request state, so a single client can be shared by
+    all the threads of a process.
     """
     HOST_NAME = None
     RESPONSE_CLASS = None
@@ -217,21 +503,25 @@ class BaseAPIClient(object):
         :param method:
             A string of the HTTP Method to use. (GET/POST)
         :param data:
-            A dictionary of data to use with the request
+            A dictionary of data to use with the request, or a ``RequestBody``
+            to send as the raw request body.
         """
+        from urllib.parse import urlencode
         url = self.HOST_NAME + endpoint
+        if isinstance(data, RequestBody):
+            return url, data
         query_data = data and urlencode(data, doseq=1)
         if method == "GET" and query_data:
             url += "?" + query_data
             query_data = None
         return url, query_data
 
-    def _open_url(self, url, query_data):
-        if query_data:
+    def _open_url(self, url, query_data, headers=None):
+        if isinstance(query_data, str):
             query_data = query_data.encode()
-        return urlopen(url, data=query_data, timeout=self.TIMEOUT)
+        return _open(url, query_data, self.TIMEOUT, headers)
 
-    def fetch_response(self, endpoint, method="GET", data=None):
+    def fetch_response(self, endpoint, method="GET", data=None, headers=None):
         """
         Main Method that fetches url.
 
@@ -241,10 +531,13 @@ class BaseAPIClient(object):
             A string of the HTTP method to use. Must be upper case.
         :param **data:
             keyword arguments for all data items to be used to make the request.
+        :param headers:
+            An optional dictionary of extra HTTP headers to send.
         """
+        from urllib.error import HTTPError
         try:
             url, query_data = self._get_url_and_data(endpoint, method, data or None)
-            response = self._open_url(url, query_data)
+            response = self._open_url(url, query_data, headers)
         except HTTPError as e:
             response = e
         return self.RESPONSE_CLASS and self.RESPONSE_CLASS(response) or response
@@ -262,6 +555,9 @@ class JSONApiResponse(BaseResponse):
 
     You still need to be careful that the response is a json string in the
     first place (you didn't get some crazy non-json error)
+
+    Like the content, the json is loaded only once even when several
+    threads ask for it at the same time.
     """
     _json = None
 
@@ -271,5 +567,304 @@ class JSONApiResponse(BaseResponse):
             if isinstance(content, bytes):
                 content = content.decode("utf-8")
 
-            self._json = json.loads(content)
+            import json
+            with self._get_lock():
+                if self._json is None:
+                    self._json = json.loads(content)
         return self._json
+
+
+class PollingAPIClient(BaseAPIClient):
+    """
+    Client for endpoints that are polled over and over.
+
+    Remembers the last successful response for every url and makes the next
+    request conditional on its ``ETag``/``Last-Modified`` headers. When the
+    server answers "304 Not Modified" (or sends back identical content) the
+    previous response is returned as is, so its parsed json is reused
+    rather than loaded again.
+
+    USAGE:
+
+      class StatusClient(PollingAPIClient):
+          HOST_NAME = "http://www.example.com"
+
+      client = StatusClient()
+      response, changed = client.poll("/status/")
+      client.watch("/status/", callback=handle_status, stop=stop_event)
+
+    A client can be shared between threads. Threads polling the same url at
+    the same moment may each see (and report) the same change.
+
+    Only the MAX_POLLED_URLS most recently polled urls are remembered, so
+    polling with ever-changing query data doesn't grow memory without limit.
+    """
+    RESPONSE_CLASS = JSONApiResponse
+    # Seconds between polls in ``watch``. The interval is multiplied by
+    # BACKOFF each time nothing changed, up to MAX_INTERVAL.
+    MIN_INTERVAL = 1
+    MAX_INTERVAL = 60
+    BACKOFF = 2
+    MAX_POLLED_URLS = 128
+
+    def poll(self, endpoint, data=None):
+        """
+        Makes a conditional GET request to endpoint.
+
+        Returns a tuple of (response, changed). When nothing changed since
+        the last poll, response is the previous response object.
+        """
+        url, _ = self._get_url_and_data(endpoint, "GET", data or None)
+        previous, validators = self._get_polled().get(url, (None, None))
+        response = self.fetch_response(endpoint, data=data, headers=validators)
+        if self._is_unchanged(response, previous):
+            # Keep the previous response (and its parsed json), but send
+            # whatever validators the server gave us this time from now on.
+            self._remember(url, previous, self._get_conditional_headers(response.headers) or validators)
+            return previous, False
+        if response.is_success:
+            response.content  # read the body now, it's kept for comparison
+            self._remember(url, response, self._get_conditional_headers(response.headers))
+        return response, response.is_success
+
+    def watch(self, endpoint, callback, data=None, stop=None):
+        """
+        Polls endpoint until ``stop`` (a ``threading.Event``) is set, calling
+        ``callback(response)`` with the first response and again each time
+        the content changes. Unsuccessful responses and network errors
+        (``URLError``, socket timeouts, dropped connections) are skipped, and
+        count as "unchanged" so the interval backs off.
+        """
+        stop = stop or threading.Event()
+        interval = self.MIN_INTERVAL
+        while not stop.is_set():
+            response, changed = self._poll_for_watch(endpoint, data)
+            if changed:
+                callback(response)
+            interval = self._next_interval(interval, changed)
+            stop.wait(interval)
+
+    def _poll_for_watch(self, endpoint, data):
+        try:
+            return self.poll(endpoint, data)
+        except OSError:
+            # URLError and socket errors/timeouts are all OSErrors. HTTP
+            # errors never get here, fetch_response returns them.
+            return None, False
+
+    def _next_interval(self, interval, changed):
+        if changed:
+            return self.MIN_INTERVAL
+        return min(interval * self.BACKOFF, self.MAX_INTERVAL)
+
+    def _get_polled(self):
+        # Created on first use so subclasses don't have to call __init__.
+        # setdefault is atomic, so threads sharing the client get one dict.
+        polled = self.__dict__.get("_polled")
+        if polled is None:
+            polled = self.__dict__.setdefault("_polled", OrderedDict())
+        return polled
+
+    def _remember(self, url, response, validators):
+        polled = self._get_polled()
+        polled.pop(url, None)
+        polled[url] = (response, validators)
+        if len(polled) > self.MAX_POLLED_URLS:
+            polled.popitem(last=False)
+
+    def _get_conditional_headers(self, response_headers):
+        headers = {}
+        if response_headers.get("ETag"):
+            headers["If-None-Match"] = response_headers["ETag"]
+        if response_headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = response_headers["Last-Modified"]
+        return headers
+
+    def _is_unchanged(self, response, previous):
+        if previous is None:
+            return False
+        return response.code == 304 or (response.is_success and response.content == previous.content)
+
+
+class SubResponse(object):
+    """
+    One response out of a batch response. Looks enough like what ``urlopen``
+    returns to be wrapped by any response class.
+    """
+
+    def __init__(self, code, content, headers=None):
+        self.code = code
+        self.content = content
+        self.headers = headers or {}
+
+    def read(self):
+        return self.content
+
+
+class _Batch(object):
+    """
+    Sub-requests collected to be sent together, and their outcome.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.responses = None
+        self.error = None
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+    def get_response(self, index):
+        self.done.wait()
+        if self.error is not None:
+            # Every waiting caller raises its own copy of the exception, so
+            # callers can still catch e.g. URLError while the threads don't
+            # pile their tracebacks onto one shared exception object.
+            raise self._copy_error() from self.error
+        return self.responses[index]
+
+    def _copy_error(self):
+        try:
+            return copy.copy(self.error)
+        except Exception:
+            return RuntimeError("Batch request failed: {0!r}".format(self.error))
+
+
+class RequestBatcher(object):
+    """
+    Combines calls to decorated API methods into single requests to a bulk
+    endpoint.
+
+    The first call waits up to ``window`` seconds (or until ``max_size``
+    calls have joined it) and then sends every call collected so far in one
+    request. Each caller blocks until its own response is in, so batching
+    only pays off when calls come from several threads at once. If the batch
+    request fails with anything but an HTTP error, every caller raises a copy
+    of the original exception (of the same type, chained to the original).
+
+    :param endpoint:
+        URL endpoint of the batch request.
+    :param encode:
+        Callable receiving a list of (method, endpoint, data) tuples, one per
+        call, and returning the batch request data. For POST (the default)
+        this must be a ``RequestBody`` such as ``JSONBody``; a dictionary is
+        only urlencoded into the query string of a GET.
+    :param decode:
+        Callable receiving the batch response wrapped in a ``BaseResponse``
+        and returning one ``SubResponse`` per call, in the same order.
+
+    USAGE:
+
+      class MyAPI(object):
+          HOST_NAME = "http://www.example.com"
+          RESPONSE_CLASS = JSONApiResponse
+          batch = RequestBatcher("/batch/", encode_batch, decode_batch)
+
+          @batch.api_request("/things/")
+          def fetch_thing(self, thing_id):
+              return {"id": thing_id}
+    """
+
+    def __init__(self, endpoint, encode, decode, max_size=50, window=0.01, method="POST",
+                 timeout=socket._GLOBAL_DEFAULT_TIMEOUT, request_class=None):
+        """
+        :param request_class:
+            ``APIRequest`` subclass used to send the batch request, e.g. a
+            ``SignedAPIRequest`` subclass to sign it.
+        """
+        self.encode = encode
+        self.decode = decode
+        self.max_size = max_size
+        self.window = window
+        self.request = (request_class or APIRequest)(endpoint, method=method, timeout=timeout)
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def api_request(self, endpoint, method="GET", response_class=None):
+        """
+        Decorator like ``api_request``, but the call is sent through this batcher.
+
+        Every call takes up to ``window`` seconds longer than a direct request
+        would, since the first call of a batch waits for others to join it
+        (a lone caller waits the whole window). Set ``window`` to 0 or
+        ``max_size`` to 1 to send each call right away.
+        """
+        return BatchedAPIRequest(self, endpoint, method=method, response_class=response_class)
+
+    def submit(self, cls, sub_request):
+        """
+        Adds sub_request to the batch being collected for the API object
+        ``cls`` and returns its ``SubResponse`` once the batch is sent.
+        """
+        batch, index = self._join(cls, sub_request)
+        if index == 0:
+            if self.max_size > 1 and self.window:
+                batch.full.wait(self.window)
+            with self._lock:
+                self._close(cls, batch)
+                requests = list(batch.requests)
+            self._send(cls, batch, requests)
+        return batch.get_response(index)
+
+    def _join(self, cls, sub_request):
+        with self._lock:
+            batch = self._pending.get(id(cls))
+            if batch is None:
+                batch = self._pending[id(cls)] = _Batch()
+            batch.requests.append(sub_request)
+            if len(batch.requests) >= self.max_size:
+                self._close(cls, batch)
+                batch.full.set()
+            return batch, len(batch.requests) - 1
+
+    def _close(self, cls, batch):
+        # Stop more calls from joining. Must be called with the lock held.
+        if self._pending.get(id(cls)) is batch:
+            del self._pending[id(cls)]
+
+    def _send(self, cls, batch, requests):
+        try:
+            batch.responses = self._fetch(cls, requests)
+        except Exception as e:
+            batch.error = e
+        except BaseException as e:
+            # e.g. KeyboardInterrupt in this thread: let it go on, but don't
+            # leave the other callers without a result or an error.
+            batch.error = RuntimeError("Batch request was interrupted by {0!r}".format(e))
+            batch.error.__cause__ = e
+            raise
+        finally:
+            batch.done.set()
+
+    def _fetch(self, cls, requests):
+        from urllib.error import HTTPError
+        try:
+            url, data = self.request._get_url_and_data(self.encode(requests), cls)
+            response = BaseResponse(self.request._open_url(url, data))
+        except HTTPError as e:
+            error = BaseResponse(e)
+            return [SubResponse(error.code, error.content, error.headers) for _ in requests]
+        responses = list(self.decode(response))
+        if len(responses) != len(requests):
+            raise ValueError("Batch response has {0} responses for {1} requests".format(len(responses), len(requests)))
+        return responses
+
+
+class BatchedAPIRequest(APIRequest):
+    """
+    API method decorator that sends the call as part of a batch.
+    Use ``RequestBatcher.api_request`` to create one.
+    """
+
+    def __init__(self, batcher, endpoint, method="GET", response_class=None):
+        super(BatchedAPIRequest, self).__init__(endpoint, method=method, response_class=response_class)
+        self.batcher = batcher
+
+    def __call__(self, method):
+
+        @wraps(method)
+        def _inner(cls, *args, **kwargs):
+            method_data = method(cls, *args, **kwargs)
+            response = self.batcher.submit(cls, (self.method, self.endpoint, method_data))
+            return self.prepare_response(response, cls)
+
+        return _inner
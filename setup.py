@@ -12,7 +12,7 @@ LONG_DESCRIPTION = open(readme, 'r').read()
 
 setup(
     name='apyclient',
-    version='0.3.1',
+    version='0.4.0',
     url='https://github.com/madisona/apyclient',
     license='BSD',
     author='Aaron Madison',
@@ -21,6 +21,7 @@ setup(
     long_description=LONG_DESCRIPTION,
     py_modules=['apyclient'],
     install_requires=['apysigner>=3.0.1'],
+    python_requires='>=3.7',
 
     zip_safe=False,
     classifiers=[
@@ -29,8 +30,9 @@ setup(
         "License :: OSI Approved :: BSD License",
         "Operating System :: OS Independent",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2.7",
-        "Programming Language :: Python :: 3.5",
+        "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3.7",
+        "Programming Language :: Python :: 3.8",
         "Topic :: Software Development",
         "Topic :: Software Development :: Libraries :: Application Frameworks",
         "Topic :: Software Development :: Libraries :: Python Modules",
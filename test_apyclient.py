@@ -1,19 +1,25 @@
 #!/usr/bin/env python
 
-import six
-from io import StringIO
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO, StringIO
+import hashlib
 import json
 import mock
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
 from unittest import TestCase, main
+from urllib.parse import parse_qs, urlparse
+from urllib.error import HTTPError, URLError
+from urllib.response import addinfourl
 
 import apyclient
-
-if six.PY2:
-    from urllib2 import HTTPError
-    from urllib import addinfourl
-else:
-    from urllib.response import addinfourl
-    from urllib.error import HTTPError
+import apysigner
 
 
 class CustomResponse(object):
@@ -79,6 +85,36 @@ class ApiCustomResponseStub(ApiStub):
         return {}
 
 
+class ImportTimeTests(TestCase):
+    """
+    Runs ``python -X importtime -c "import apyclient"`` in a fresh
+    interpreter to make sure importing stays cheap.
+    """
+
+    def get_imported_modules(self):
+        output = subprocess.check_output(
+            [sys.executable, "-X", "importtime", "-c", "import apyclient"],
+            stderr=subprocess.STDOUT,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).decode("utf-8")
+        # lines look like "import time:  self [us] | cumulative | imported package"
+        rows = [line.split("|") for line in output.splitlines() if line.startswith("import time:")][1:]
+        return set(row[2].strip() for row in rows)
+
+    def test_import_does_not_load_dependencies(self):
+        imported = self.get_imported_modules()
+        self.assertIn("apyclient", imported)
+        for name in ("six", "apysigner", "json", "urllib.request", "urllib.parse", "tempfile", "uuid"):
+            self.assertNotIn(name, imported)
+
+    def test_dependencies_load_on_first_use(self):
+        output = subprocess.check_output(
+            [sys.executable, "-c", "import sys, apyclient; apyclient.JSONBody({}); print('json' in sys.modules)"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        self.assertEqual(b"True", output.strip())
+
+
 class BaseResponseTests(TestCase):
 
     def test_status_code(self):
@@ -286,6 +322,104 @@ class JSONApiResponseTests(TestCase):
         self.assertEqual(1, load.call_count)
 
 
+class RequestBodyTests(TestCase):
+
+    def test_streams_buffer_in_chunks(self):
+        body = apyclient.RequestBody(memoryview(b"abcdefg"), chunk_size=3)
+        self.assertEqual([b"abc", b"def", b"g"], list(body))
+
+    def test_chunk_size_counts_bytes_of_typed_buffers(self):
+        data = array('i', range(10))
+        body = apyclient.RequestBody(memoryview(data), chunk_size=8)
+
+        chunks = list(body)
+        self.assertEqual([8] * (len(data.tobytes()) // 8), [len(c) for c in chunks])
+        self.assertEqual(data.tobytes(), b"".join(chunks))
+        self.assertEqual(len(data.tobytes()), body.payload.nbytes)
+
+    def test_passes_buffer_through_as_payload(self):
+        body = apyclient.RequestBody(b"abcdefg")
+        self.assertIsInstance(body.payload, memoryview)
+        self.assertEqual(b"abcdefg", body.payload.tobytes())
+
+    def test_streams_file_object_in_chunks(self):
+        body = apyclient.RequestBody(BytesIO(b"abcdefg"), chunk_size=4)
+        self.assertEqual([b"abcd", b"efg"], list(body))
+        self.assertEqual(body, body.payload)
+
+    def test_rewinds_file_object_to_starting_position(self):
+        data = BytesIO(b"skip-abcdefg")
+        data.seek(5)
+        body = apyclient.RequestBody(data, chunk_size=4)
+        list(body)
+        self.assertEqual([b"abcd", b"efg"], list(body))
+
+    def test_sends_text_data_as_single_encoded_buffer(self):
+        body = apyclient.RequestBody(u"hello")
+        self.assertEqual([b"hello"], list(body))
+        self.assertEqual(b"hello", body.payload.tobytes())
+
+    def test_encodes_text_chunks_from_iterator(self):
+        body = apyclient.RequestBody(iter([u"abc", b"def"]))
+        self.assertEqual([b"abc", b"def"], list(body))
+
+    def test_spools_one_shot_iterator_when_digesting(self):
+        body = apyclient.RequestBody(iter([b"abc", b"def"]))
+        digest = body.update_digest(hashlib.sha256())
+
+        self.assertEqual(hashlib.sha256(b"abcdef").digest(), digest.digest())
+        self.assertEqual(b"abcdef", b"".join(body))
+
+    def test_builds_request_with_content_type(self):
+        body = apyclient.RequestBody(b"abc", content_type="text/plain")
+        request = body.get_request("http://www.example.com/upload/")
+
+        self.assertEqual("text/plain", request.get_header("Content-type"))
+        self.assertEqual(b"abc", request.data.tobytes())
+
+    def test_json_body_serializes_object(self):
+        body = apyclient.JSONBody({"this": ["is", 1]})
+        self.assertEqual("application/json", body.content_type)
+        self.assertEqual({"this": ["is", 1]}, json.loads(b"".join(body).decode("utf-8")))
+
+    def test_multipart_body_streams_fields_and_files(self):
+        body = apyclient.MultipartBody(
+            fields=[("name", u"value")],
+            files=[("upload", ("a.txt", BytesIO(b"file content"), "text/plain"))],
+            boundary="xyz",
+        )
+        expected = (
+            b'--xyz\r\nContent-Disposition: form-data; name="name"\r\n\r\nvalue\r\n'
+            b'--xyz\r\nContent-Disposition: form-data; name="upload"; filename="a.txt"\r\n'
+            b'Content-Type: text/plain\r\n\r\nfile content\r\n'
+            b'--xyz--\r\n'
+        )
+        self.assertEqual("multipart/form-data; boundary=xyz", body.content_type)
+        self.assertEqual(expected, b"".join(body))
+        self.assertEqual(expected, b"".join(body))
+
+    def test_multipart_body_sends_field_values_as_text(self):
+        body = apyclient.MultipartBody(fields=[("times", 5), ("flag", True)], boundary="xyz")
+        expected = (
+            b'--xyz\r\nContent-Disposition: form-data; name="times"\r\n\r\n5\r\n'
+            b'--xyz\r\nContent-Disposition: form-data; name="flag"\r\n\r\nTrue\r\n'
+            b'--xyz--\r\n'
+        )
+        self.assertEqual(expected, b"".join(body))
+
+    def test_multipart_body_escapes_names_and_filenames(self):
+        body = apyclient.MultipartBody(
+            files=[('up"load', ('a".txt\r\nX-Injected: yes', BytesIO(b"data")))],
+            boundary="xyz",
+        )
+        header = b"".join(body).split(b"\r\n\r\n")[0]
+        self.assertEqual(
+            b'--xyz\r\nContent-Disposition: form-data; name="up%22load"; filename="a%22.txt%0D%0AX-Injected: yes"\r\n'
+            b'Content-Type: application/octet-stream',
+            header,
+        )
+
+
 class ClientStub(apyclient.BaseAPIClient):
     HOST_NAME = "http://www.example.com"
     TIMEOUT = 10
@@ -306,6 +440,9 @@ class ClientStub(apyclient.BaseAPIClient):
     def do_simple(self):
         return self.fetch_response("/do-simple/")
 
+    def do_upload(self, body):
+        return self.fetch_response("/do-upload/", method="POST", data=body)
+
 
 class CustomResponseClientStub(ClientStub):
     RESPONSE_CLASS = apyclient.JSONApiResponse
@@ -380,6 +517,18 @@ class BaseAPIClientTests(TestCase):
         self.assertIsInstance(response, apyclient.JSONApiResponse)
         self.assertEqual(resp, response.original_response)
 
+    @mock.patch("apyclient.urlopen")
+    def test_sends_request_body_as_streamed_request(self, urlopen):
+        api = ClientStub()
+        body = apyclient.RequestBody(BytesIO(b"file content"), content_type="text/plain")
+        api.do_upload(body)
+
+        request = urlopen.call_args[0][0]
+        self.assertEqual("http://www.example.com/do-upload/", request.get_full_url())
+        self.assertEqual(body, request.data)
+        self.assertEqual("text/plain", request.get_header("Content-type"))
+        self.assertEqual({"timeout": 10}, urlopen.call_args[1])
+
 
 class BaseSignedAPIClientTests(TestCase):
 
@@ -443,6 +592,411 @@ class BaseSignedAPIClientTests(TestCase):
         )
         urlopen.assert_called_once_with(expected_url, data=query_data, timeout=sut.TIMEOUT)
 
+    def test_signs_streamed_body_same_as_string_payload(self):
+        endpoint = "/do_this/"
+        sut = TestSignedClient()
+        body = apyclient.RequestBody(iter([b"thing=", b"clap"]))
+
+        signed_url = sut._get_signed_url(endpoint, body)
+        expected_url = sut._get_signed_url(endpoint, None).split("&")[0] + "&{0}={1}".format(
+            sut.SIGNATURE_PARAM_NAME,
+            apysigner.get_signature(sut.PRIVATE_KEY, endpoint + "?ClientId=client-test", "thing=clap"),
+        )
+        self.assertEqual(expected_url, signed_url)
+        self.assertEqual(b"thing=clap", b"".join(body))
+
+
+class PollingClientStub(apyclient.PollingAPIClient):
+    HOST_NAME = "http://www.example.com"
+    TIMEOUT = 10
+    MIN_INTERVAL = 0
+
+
+class PollingAPIClientTests(TestCase):
+
+    def get_response(self, content=u'{"status": "ok"}', headers=None):
+        headers = headers if headers is not None else {"ETag": '"v1"', "Last-Modified": "Mon, 19 Oct 2026 10:00:00 GMT"}
+        return addinfourl(BytesIO(content.encode("utf-8")), headers, url="http://www.example.com/", code=200)
+
+    def get_not_modified(self):
+        return HTTPError(url="http://www.example.com/", code=304, msg="Not Modified", hdrs={}, fp=BytesIO(b""))
+
+    @mock.patch("apyclient.urlopen")
+    def test_first_poll_is_unconditional_and_changed(self, urlopen):
+        urlopen.return_value = self.get_response()
+        sut = PollingClientStub()
+
+        response, changed = sut.poll("/status/", data={"id": 5})
+
+        urlopen.assert_called_once_with("http://www.example.com/status/?id=5", data=None, timeout=10)
+        self.assertTrue(changed)
+        self.assertEqual({"status": "ok"}, response.json())
+
+    @mock.patch("apyclient.urlopen")
+    def test_sends_validators_from_previous_response(self, urlopen):
+        urlopen.side_effect = [self.get_response(), self.get_not_modified()]
+        sut = PollingClientStub()
+        sut.poll("/status/")
+        sut.poll("/status/")
+
+        request = urlopen.call_args[0][0]
+        self.assertEqual("http://www.example.com/status/", request.get_full_url())
+        self.assertEqual('"v1"', request.get_header("If-none-match"))
+        self.assertEqual("Mon, 19 Oct 2026 10:00:00 GMT", request.get_header("If-modified-since"))
+
+    @mock.patch("apyclient.urlopen")
+    def test_returns_previous_response_without_reparsing_when_not_modified(self, urlopen):
+        urlopen.side_effect = [self.get_response(), self.get_not_modified()]
+        sut = PollingClientStub()
+        first, _ = sut.poll("/status/")
+        first.json()
+
+        with mock.patch("json.loads") as loads:
+            response, changed = sut.poll("/status/")
+            response.json()
+
+        self.assertFalse(changed)
+        self.assertIs(first, response)
+        self.assertEqual(0, loads.call_count)
+
+    @mock.patch("apyclient.urlopen")
+    def test_identical_content_is_not_a_change(self, urlopen):
+        urlopen.side_effect = [self.get_response(headers={}), self.get_response(headers={})]
+        sut = PollingClientStub()
+        first, _ = sut.poll("/status/")
+        response, changed = sut.poll("/status/")
+
+        self.assertFalse(changed)
+        self.assertIs(first, response)
+
+    @mock.patch("apyclient.urlopen")
+    def test_identical_content_updates_validators(self, urlopen):
+        urlopen.side_effect = [
+            self.get_response(),
+            self.get_response(headers={"ETag": '"v2"'}),
+            self.get_not_modified(),
+        ]
+        sut = PollingClientStub()
+        first, _ = sut.poll("/status/")
+        sut.poll("/status/")
+        response, changed = sut.poll("/status/")
+
+        self.assertEqual('"v2"', urlopen.call_args[0][0].get_header("If-none-match"))
+        self.assertFalse(changed)
+        self.assertIs(first, response)
+
+    @mock.patch("apyclient.urlopen")
+    def test_works_when_subclass_init_does_not_call_super(self, urlopen):
+        class OwnInitClient(PollingClientStub):
+            def __init__(self):
+                self.name = "own"
+
+        urlopen.side_effect = [self.get_response(), self.get_not_modified()]
+        sut = OwnInitClient()
+        first, _ = sut.poll("/status/")
+        response, changed = sut.poll("/status/")
+
+        self.assertFalse(changed)
+        self.assertIs(first, response)
+
+    @mock.patch("apyclient.urlopen")
+    def test_forgets_least_recently_polled_urls(self, urlopen):
+        urlopen.side_effect = [self.get_response() for _ in range(3)]
+        sut = PollingClientStub()
+        sut.MAX_POLLED_URLS = 2
+        for i in range(3):
+            sut.poll("/status/", data={"id": i})
+
+        self.assertEqual(
+            ["http://www.example.com/status/?id=1", "http://www.example.com/status/?id=2"],
+            list(sut._get_polled()),
+        )
+
+    @mock.patch("apyclient.urlopen")
+    def test_new_content_replaces_previous_response(self, urlopen):
+        urlopen.side_effect = [self.get_response(), self.get_response(u'{"status": "down"}')]
+        sut = PollingClientStub()
+        sut.poll("/status/")
+        response, changed = sut.poll("/status/")
+
+        self.assertTrue(changed)
+        self.assertEqual({"status": "down"}, response.json())
+
+    @mock.patch("apyclient.urlopen")
+    def test_watch_keeps_going_and_backs_off_on_network_errors(self, urlopen):
+        urlopen.side_effect = [URLError("name resolution failed"), socket.timeout("timed out"), self.get_response()]
+        stop = mock.Mock(is_set=mock.Mock(side_effect=[False, False, False, True]))
+        callback = mock.Mock()
+
+        with mock.patch.object(PollingClientStub, "MIN_INTERVAL", 1):
+            PollingClientStub().watch("/status/", callback, stop=stop)
+
+        self.assertEqual([{"status": "ok"}], [c[0][0].json() for c in callback.call_args_list])
+        self.assertEqual([mock.call(2), mock.call(4), mock.call(1)], stop.wait.call_args_list)
+
+    def test_backs_off_while_unchanged_and_resets_on_change(self):
+        sut = apyclient.PollingAPIClient()
+        self.assertEqual(4, sut._next_interval(2, False))
+        self.assertEqual(sut.MAX_INTERVAL, sut._next_interval(sut.MAX_INTERVAL, False))
+        self.assertEqual(sut.MIN_INTERVAL, sut._next_interval(32, True))
+
+    @mock.patch("apyclient.urlopen")
+    def test_watch_calls_back_only_on_changes(self, urlopen):
+        urlopen.side_effect = [
+            self.get_response(),
+            self.get_not_modified(),
+            self.get_response(u'{"status": "down"}', headers={"ETag": '"v2"'}),
+        ]
+        stop = mock.Mock(is_set=mock.Mock(side_effect=[False, False, False, True]))
+        callback = mock.Mock()
+
+        PollingClientStub().watch("/status/", callback, stop=stop)
+
+        self.assertEqual([{"status": "ok"}, {"status": "down"}], [c[0][0].json() for c in callback.call_args_list])
+        self.assertEqual([mock.call(0), mock.call(0), mock.call(0)], stop.wait.call_args_list)
+
+
+class SlowResponseStub(ResponseStub):
+
+    def __init__(self, content):
+        super(SlowResponseStub, self).__init__(code=200, content=content)
+        self.read_count = 0
+
+    def read(self):
+        self.read_count += 1
+        time.sleep(0.01)
+        content, self.content = self.content, b""
+        return content
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        content = json.dumps({"path": urlparse(self.path).path, "id": query["id"][0]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class EchoServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class SharedClientStub(apyclient.BaseAPIClient):
+    RESPONSE_CLASS = apyclient.JSONApiResponse
+
+    @apyclient.api_request("/decorated/", response_class=apyclient.JSONApiResponse)
+    def fetch_decorated(self, request_id):
+        return {"id": request_id}
+
+    def fetch_plain(self, request_id):
+        return self.fetch_response("/plain/", data={"id": request_id})
+
+
+class ThreadSafetyTests(TestCase):
+    thread_count = 64
+
+    def run_in_threads(self, func, count):
+        with ThreadPoolExecutor(max_workers=self.thread_count) as pool:
+            return list(pool.map(func, range(count)))
+
+    def test_shared_response_reads_and_parses_content_once(self):
+        raw = SlowResponseStub(json.dumps({"this": "is_test_data"}).encode("utf-8"))
+        response = apyclient.JSONApiResponse(raw)
+
+        results = self.run_in_threads(lambda _: response.json(), self.thread_count)
+
+        self.assertEqual(1, raw.read_count)
+        self.assertEqual([{"this": "is_test_data"}] * self.thread_count, results)
+
+    def test_response_subclass_without_super_init_is_shared_safely(self):
+        class OwnInitResponse(apyclient.JSONApiResponse):
+            def __init__(self, response):
+                self.original_response = response
+
+        raw = SlowResponseStub(json.dumps({"this": "is_test_data"}).encode("utf-8"))
+        response = OwnInitResponse(raw)
+
+        results = self.run_in_threads(lambda _: response.json(), self.thread_count)
+
+        self.assertEqual(1, raw.read_count)
+        self.assertEqual([{"this": "is_test_data"}] * self.thread_count, results)
+
+    def test_shared_client_under_local_server(self):
+        server = EchoServer(("127.0.0.1", 0), EchoHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        client = SharedClientStub()
+        client.HOST_NAME = "http://127.0.0.1:{0}".format(server.server_port)
+
+        def call(i):
+            fetch = client.fetch_decorated if i % 2 else client.fetch_plain
+            return fetch(str(i)).json()
+
+        results = self.run_in_threads(call, self.thread_count * 4)
+
+        expected = [{"path": "/decorated/" if i % 2 else "/plain/", "id": str(i)} for i in range(self.thread_count * 4)]
+        self.assertEqual(expected, results)
+
+
+def encode_batch(requests):
+    return apyclient.JSONBody([{"method": m, "path": endpoint, "params": data} for m, endpoint, data in requests])
+
+
+def decode_batch(response):
+    return [apyclient.SubResponse(item["status"], json.dumps(item["body"])) for item in json.loads(response.content)]
+
+
+class BatchedApiStub(object):
+    HOST_NAME = "http://www.example.com"
+    RESPONSE_CLASS = apyclient.JSONApiResponse
+    batch = apyclient.RequestBatcher("/batch/", encode_batch, decode_batch, max_size=8, window=5, timeout=10)
+
+    @batch.api_request("/things/")
+    def fetch_thing(self, thing_id):
+        return {"id": thing_id}
+
+    @batch.api_request("/custom/", method="POST", response_class=CustomResponse)
+    def do_custom(self):
+        return {}
+
+
+class RequestBatcherTests(TestCase):
+
+    def get_batch_response(self, items):
+        content = json.dumps([{"status": 200, "body": item} for item in items]).encode("utf-8")
+        return addinfourl(BytesIO(content), {}, url="http://www.example.com/batch/", code=200)
+
+    def call_in_threads(self, func, count):
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            return list(pool.map(func, range(count)))
+
+    @mock.patch("apyclient.urlopen")
+    def test_combines_concurrent_calls_into_one_request(self, urlopen):
+        urlopen.return_value = self.get_batch_response(["thing-{0}".format(i) for i in range(8)])
+        api = BatchedApiStub()
+
+        responses = self.call_in_threads(api.fetch_thing, 8)
+
+        self.assertEqual(1, urlopen.call_count)
+        request = urlopen.call_args[0][0]
+        self.assertEqual("http://www.example.com/batch/", request.get_full_url())
+        self.assertEqual({"timeout": 10}, urlopen.call_args[1])
+        sent = json.loads(request.data.tobytes().decode("utf-8"))
+        self.assertEqual(list(range(8)), sorted(item["params"]["id"] for item in sent))
+        # every caller gets the sub-response at its own position in the batch
+        by_id = dict((item["params"]["id"], "thing-{0}".format(i)) for i, item in enumerate(sent))
+        for thing_id, response in enumerate(responses):
+            self.assertIsInstance(response, apyclient.JSONApiResponse)
+            self.assertEqual(by_id[thing_id], response.json())
+
+    @mock.patch("apyclient.urlopen")
+    def test_sends_partial_batch_when_window_ends(self, urlopen):
+        urlopen.return_value = self.get_batch_response(["only"])
+        api = BatchedApiStub()
+
+        with mock.patch.object(BatchedApiStub.batch, "window", 0):
+            response = api.fetch_thing(3)
+
+        sent = json.loads(urlopen.call_args[0][0].data.tobytes().decode("utf-8"))
+        self.assertEqual([{"method": "GET", "path": "/things/", "params": {"id": 3}}], sent)
+        self.assertEqual("only", response.json())
+
+    @mock.patch("apyclient.urlopen")
+    def test_uses_response_class_declared_on_method(self, urlopen):
+        urlopen.return_value = self.get_batch_response([{}])
+        api = BatchedApiStub()
+
+        with mock.patch.object(BatchedApiStub.batch, "window", 0):
+            response = api.do_custom()
+
+        self.assertIsInstance(response, CustomResponse)
+        self.assertIsInstance(response._response, apyclient.SubResponse)
+
+    @mock.patch("apyclient.urlopen")
+    def test_gives_every_caller_the_batch_error_response(self, urlopen):
+        urlopen.side_effect = HTTPError(
+            url="http://www.example.com/batch/", code=503, msg="Unavailable", hdrs={}, fp=BytesIO(b"down"))
+        api = BatchedApiStub()
+
+        responses = self.call_in_threads(api.fetch_thing, 8)
+
+        self.assertEqual([503] * 8, [r.code for r in responses])
+        self.assertEqual([b"down"] * 8, [r.content for r in responses])
+
+    @mock.patch("apyclient.urlopen")
+    def test_raises_in_every_caller_when_decoded_responses_do_not_match(self, urlopen):
+        urlopen.return_value = self.get_batch_response(["just one"])
+        api = BatchedApiStub()
+
+        def call(i):
+            with self.assertRaises(ValueError) as raised:
+                api.fetch_thing(i)
+            return raised.exception
+
+        errors = self.call_in_threads(call, 8)
+        self.assertEqual(1, urlopen.call_count)
+        self.assertEqual(8, len(set(id(e) for e in errors)))
+        self.assertEqual(1, len(set(id(e.__cause__) for e in errors)))
+        self.assertIsInstance(errors[0].__cause__, ValueError)
+
+    @mock.patch("apyclient.urlopen")
+    def test_raises_network_errors_with_their_own_type(self, urlopen):
+        urlopen.side_effect = URLError("connection refused")
+        api = BatchedApiStub()
+
+        def call(i):
+            with self.assertRaises(URLError) as raised:
+                api.fetch_thing(i)
+            return raised.exception
+
+        errors = self.call_in_threads(call, 8)
+        self.assertEqual(["connection refused"] * 8, [e.reason for e in errors])
+        self.assertEqual(8, len(set(id(e) for e in errors)))
+        self.assertEqual([urlopen.side_effect] * 8, [e.__cause__ for e in errors])
+
+    @mock.patch("apyclient.urlopen")
+    def test_other_callers_get_an_error_when_sending_thread_is_interrupted(self, urlopen):
+        class Interrupted(BaseException):
+            pass
+
+        urlopen.side_effect = Interrupted()
+        api = BatchedApiStub()
+
+        def call(i):
+            try:
+                api.fetch_thing(i)
+            except BaseException as e:
+                return e
+
+        errors = self.call_in_threads(call, 8)
+        self.assertEqual(1, sum(isinstance(e, Interrupted) for e in errors))
+        others = [e for e in errors if not isinstance(e, Interrupted)]
+        self.assertEqual([RuntimeError] * 7, [type(e) for e in others])
+        self.assertIsInstance(others[0].__cause__.__cause__, Interrupted)
+
+    @mock.patch("apyclient.urlopen")
+    def test_lone_call_does_not_wait_when_window_is_zero(self, urlopen):
+        urlopen.return_value = self.get_batch_response(["only"])
+        api = BatchedApiStub()
+
+        with mock.patch.object(BatchedApiStub.batch, "window", 0):
+            with mock.patch.object(threading.Event, "wait", autospec=True, return_value=True) as wait:
+                response = api.fetch_thing(3)
+
+        self.assertEqual("only", response.json())
+        # only the wait for the (already sent) batch's responses
+        self.assertEqual(1, wait.call_count)
+
 
 if __name__ == '__main__':
     main()